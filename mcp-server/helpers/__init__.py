@@ -1,8 +1,20 @@
-"""Dataiku helper modules for common operations."""
+"""Dataiku helper modules for common operations.
 
-from . import jobs
-from . import inspection
-from . import search
-from . import export
+Submodules are imported on first access so the server starts faster.
+"""
+
+import importlib
 
 __all__ = ["jobs", "inspection", "search", "export"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
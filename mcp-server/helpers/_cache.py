@@ -0,0 +1,26 @@
+"""Caches shared by the helper modules."""
+
+import weakref
+
+# client -> {project_key: DSSProject}; entries go away with their client
+_project_handles = weakref.WeakKeyDictionary()
+
+
+def get_project(client, project_key: str):
+    """Get a project handle, reusing the one already created for this client.
+
+    Args:
+        client: DSSClient instance
+        project_key: Project key
+
+    Returns:
+        DSSProject handle
+    """
+    handles = _project_handles.get(client)
+    if handles is None:
+        handles = _project_handles.setdefault(client, {})
+
+    project = handles.get(project_key)
+    if project is None:
+        project = handles.setdefault(project_key, client.get_project(project_key))
+    return project
@@ -3,8 +3,15 @@
 These helpers get data out of Dataiku in useful formats.
 """
 
+import logging
+import math
+from itertools import islice
 from typing import Optional, Iterator, Dict, Any, List
 
+from ._cache import get_project
+
+logger = logging.getLogger(__name__)
+
 
 def to_records(client, project_key: str, dataset_name: str,
                limit: int = 100) -> list:
@@ -19,7 +26,7 @@ def to_records(client, project_key: str, dataset_name: str,
     Returns:
         list of dicts, one per row
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     dataset = project.get_dataset(dataset_name)
 
     # Get schema to build dicts (iter_rows returns lists, not dicts)
@@ -28,14 +35,18 @@ def to_records(client, project_key: str, dataset_name: str,
     col_names = [col.get("name") for col in schema]
 
     rows = []
-    for i, row in enumerate(dataset.iter_rows()):
-        if i >= limit:
-            break
-        # Convert list to dict
-        if isinstance(row, dict):
-            rows.append(row)
-        else:
-            rows.append(dict(zip(col_names, row)))
+    rows_append = rows.append
+    # Close the stream once we have enough rows instead of reading it all
+    row_iter = dataset.iter_rows()
+    try:
+        for row in islice(row_iter, max(math.ceil(limit), 0)):
+            # Convert list to dict
+            if isinstance(row, dict):
+                rows_append(row)
+            else:
+                rows_append(dict(zip(col_names, row)))
+    finally:
+        row_iter.close()
     return rows
 
 
@@ -65,7 +76,7 @@ def get_schema(client, project_key: str, dataset_name: str) -> list:
     Returns:
         list of (column_name, column_type) tuples
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     dataset = project.get_dataset(dataset_name)
     settings = dataset.get_settings()
 
@@ -99,15 +110,15 @@ def count_rows(client, project_key: str, dataset_name: str) -> Optional[int]:
     Returns:
         int row count or None if not available
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     dataset = project.get_dataset(dataset_name)
 
     try:
         metrics = dataset.get_last_metric_values()
         if metrics:
             return metrics.get_global_value("records:COUNT_RECORDS")
-    except:
-        pass
+    except Exception as e:
+        logger.debug("No row count for %s.%s: %s", project_key, dataset_name, e)
 
     return None
 
@@ -178,13 +189,20 @@ def to_csv_string(client, project_key: str, dataset_name: str,
     import csv
     from io import StringIO
 
-    schema = get_schema(client, project_key, dataset_name)
-    columns = [name for name, _ in schema]
-    rows = to_records(client, project_key, dataset_name, limit=limit)
+    project = get_project(client, project_key)
+    dataset = project.get_dataset(dataset_name)
+    columns = get_column_names(client, project_key, dataset_name)
 
     output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=columns)
-    writer.writeheader()
-    writer.writerows(rows)
+    writer = csv.writer(output)
+    writer.writerow(columns)
+
+    # iter_rows yields lists in schema order, so write them straight through
+    # instead of round-tripping each row through a dict
+    row_iter = dataset.iter_rows()
+    try:
+        writer.writerows(islice(row_iter, max(math.ceil(limit), 0)))
+    finally:
+        row_iter.close()
 
     return output.getvalue()
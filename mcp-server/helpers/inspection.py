@@ -3,8 +3,28 @@
 These helpers combine multiple API calls into single useful views.
 """
 
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Optional
 
+from ._cache import get_project
+
+logger = logging.getLogger(__name__)
+
+# Connection params never returned by connection_info
+_SECRET_KEYS = frozenset({
+    "password",
+    "secretKey",
+    "privateKey",
+    "privateKeyPassword",
+    "clientSecret",
+    "token",
+    "accessToken",
+    "refreshToken",
+})
+
 
 def dataset_info(client, project_key: str, dataset_name: str,
                  sample_size: int = 5) -> dict:
@@ -19,17 +39,18 @@ def dataset_info(client, project_key: str, dataset_name: str,
     Returns:
         dict with keys: name, type, schema, row_count, sample, connection, path
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     dataset = project.get_dataset(dataset_name)
     settings = dataset.get_settings()
+    raw = settings.get_raw()
 
     # Get schema
-    schema = settings.get_raw().get("schema", {}).get("columns", [])
+    schema = raw.get("schema", {}).get("columns", [])
     columns = [(col.get("name"), col.get("type")) for col in schema]
 
     # Get dataset type and connection info
     ds_type = settings.type
-    params = settings.get_raw().get("params", {})
+    params = raw.get("params", {})
     connection = params.get("connection")
     path = params.get("path") or params.get("table")
 
@@ -43,22 +64,27 @@ def dataset_info(client, project_key: str, dataset_name: str,
             records_metric = metrics.get_global_value("records:COUNT_RECORDS")
             if records_metric:
                 row_count = records_metric
-    except:
-        pass
+    except Exception as e:
+        logger.debug("No row count for %s.%s: %s", project_key, dataset_name, e)
 
     try:
-        # Get sample rows (iter_rows doesn't support limit param)
+        # Get sample rows (iter_rows doesn't support limit param, so stop
+        # reading and close the stream once we have enough rows)
         sample = []
-        for i, row in enumerate(dataset.iter_rows()):
-            if i >= sample_size:
-                break
-            # Convert list to dict if needed
-            if isinstance(row, dict):
-                sample.append(row)
-            else:
-                sample.append(dict(zip([c[0] for c in columns], row)))
-    except:
-        pass
+        sample_append = sample.append
+        col_names = [c[0] for c in columns]
+        rows = dataset.iter_rows()
+        try:
+            for row in islice(rows, max(math.ceil(sample_size), 0)):
+                # Convert list to dict if needed
+                if isinstance(row, dict):
+                    sample_append(row)
+                else:
+                    sample_append(dict(zip(col_names, row)))
+        finally:
+            rows.close()
+    except Exception as e:
+        logger.debug("No sample for %s.%s: %s", project_key, dataset_name, e)
 
     return {
         "name": dataset_name,
@@ -81,23 +107,28 @@ def project_summary(client, project_key: str) -> dict:
     Returns:
         dict with keys: name, datasets, recipes, scenarios, jobs, status
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
 
-    # Get project metadata
-    metadata = project.get_metadata()
+    # Fetch metadata, object lists and recent jobs concurrently
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        metadata_future = executor.submit(project.get_metadata)
+        datasets_future = executor.submit(project.list_datasets)
+        recipes_future = executor.submit(project.list_recipes)
+        scenarios_future = executor.submit(project.list_scenarios)
+        jobs_future = executor.submit(project.list_jobs)
 
-    # List all objects
-    datasets = project.list_datasets()
-    recipes = project.list_recipes()
-    scenarios = project.list_scenarios()
+    metadata = metadata_future.result()
+    datasets = datasets_future.result()
+    recipes = recipes_future.result()
+    scenarios = scenarios_future.result()
 
     # Get recent jobs
     jobs = []
     try:
-        job_list = project.list_jobs()
+        job_list = jobs_future.result()
         jobs = job_list[:5] if job_list else []
-    except:
-        pass
+    except Exception as e:
+        logger.debug("No job list for %s: %s", project_key, e)
 
     return {
         "key": project_key,
@@ -161,7 +192,7 @@ def connection_info(client, connection_name: str) -> dict:
         "type": definition.get("type"),
         "usable_by": definition.get("usableBy"),
         "params": {k: v for k, v in definition.get("params", {}).items()
-                   if k not in ("password", "secretKey", "privateKey")},
+                   if k not in _SECRET_KEYS},
         "test_result": test_result
     }
 
@@ -6,14 +6,21 @@ These helpers handle the tedious polling loops for builds, scenarios, and recipe
 import time
 from typing import Optional
 
+from ._cache import get_project
 
-def wait_for_job(job, timeout: int = 600, poll_interval: int = 2) -> dict:
+
+def wait_for_job(job, timeout: int = 600, poll_interval: float = 1,
+                 max_poll_interval: float = 30) -> dict:
     """Wait for a Dataiku job to complete.
 
+    The delay between status checks grows by 1.5x after each check, up to
+    max_poll_interval, so long jobs don't flood the server with requests.
+
     Args:
         job: A Dataiku job/future object with get_status() method
         timeout: Maximum seconds to wait (default 600)
-        poll_interval: Seconds between status checks (default 2)
+        poll_interval: Seconds before the first status re-check (default 1)
+        max_poll_interval: Maximum seconds between status checks (default 30)
 
     Returns:
         dict with keys: success, status, duration, details
@@ -21,16 +28,8 @@ def wait_for_job(job, timeout: int = 600, poll_interval: int = 2) -> dict:
     start_time = time.time()
 
     while True:
-        elapsed = time.time() - start_time
-        if elapsed > timeout:
-            return {
-                "success": False,
-                "status": "TIMEOUT",
-                "duration": elapsed,
-                "details": f"Job did not complete within {timeout} seconds"
-            }
-
         status = job.get_status()
+        elapsed = time.time() - start_time
         state = status.get("baseStatus", {}).get("state", status.get("state", "UNKNOWN"))
 
         if state in ("DONE", "FAILED", "ABORTED"):
@@ -41,7 +40,34 @@ def wait_for_job(job, timeout: int = 600, poll_interval: int = 2) -> dict:
                 "details": status
             }
 
-        time.sleep(poll_interval)
+        # Only give up after a status check made at (or past) the deadline
+        if elapsed >= timeout:
+            return {
+                "success": False,
+                "status": "TIMEOUT",
+                "duration": elapsed,
+                "details": f"Job did not complete within {timeout} seconds"
+            }
+
+        # Never sleep past the deadline
+        time.sleep(min(poll_interval, timeout - elapsed))
+        poll_interval = min(poll_interval * 1.5, max_poll_interval)
+
+
+class _ScenarioRunStatus:
+    """Adapts a scenario run to the get_status() interface used by wait_for_job."""
+
+    def __init__(self, run):
+        self.run = run
+
+    def get_status(self) -> dict:
+        run_info = self.run.get_info()
+        outcome = run_info.get("scenarioRun", {}).get("result", {}).get("outcome")
+        return {
+            "state": "RUNNING" if outcome is None else "DONE",
+            "outcome": outcome,
+            "run_info": run_info
+        }
 
 
 def build_and_wait(client, project_key: str, dataset_name: str,
@@ -59,7 +85,7 @@ def build_and_wait(client, project_key: str, dataset_name: str,
     Returns:
         dict with keys: success, status, duration, details
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     dataset = project.get_dataset(dataset_name)
 
     job = dataset.build(build_mode=build_mode)
@@ -79,36 +105,29 @@ def run_scenario_and_wait(client, project_key: str, scenario_id: str,
     Returns:
         dict with keys: success, status, duration, outcome, details
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     scenario = project.get_scenario(scenario_id)
 
     run = scenario.run()
-    start_time = time.time()
-
-    while True:
-        elapsed = time.time() - start_time
-        if elapsed > timeout:
-            return {
-                "success": False,
-                "status": "TIMEOUT",
-                "duration": elapsed,
-                "outcome": None,
-                "details": f"Scenario did not complete within {timeout} seconds"
-            }
+    result = wait_for_job(_ScenarioRunStatus(run), timeout=timeout)
 
-        run_info = run.get_info()
-        state = run_info.get("scenarioRun", {}).get("result", {}).get("outcome")
-
-        if state is not None:
-            return {
-                "success": state == "SUCCESS",
-                "status": "DONE",
-                "duration": elapsed,
-                "outcome": state,
-                "details": run_info
-            }
+    if result["status"] == "TIMEOUT":
+        return {
+            "success": False,
+            "status": "TIMEOUT",
+            "duration": result["duration"],
+            "outcome": None,
+            "details": f"Scenario did not complete within {timeout} seconds"
+        }
 
-        time.sleep(2)
+    outcome = result["details"]["outcome"]
+    return {
+        "success": outcome == "SUCCESS",
+        "status": "DONE",
+        "duration": result["duration"],
+        "outcome": outcome,
+        "details": result["details"]["run_info"]
+    }
 
 
 def run_recipe_and_wait(client, project_key: str, recipe_name: str,
@@ -124,7 +143,7 @@ def run_recipe_and_wait(client, project_key: str, recipe_name: str,
     Returns:
         dict with keys: success, status, duration, details
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     recipe = project.get_recipe(recipe_name)
 
     job = recipe.run()
@@ -142,7 +161,7 @@ def get_job_log(client, project_key: str, job_id: str) -> str:
     Returns:
         Log content as string
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     job = project.get_job(job_id)
     return job.get_log()
 
@@ -161,7 +180,7 @@ def compute_and_apply_schema(client, project_key: str, recipe_name: str) -> dict
     Returns:
         dict with keys: success, updates_applied, details
     """
-    project = client.get_project(project_key)
+    project = get_project(client, project_key)
     recipe = project.get_recipe(recipe_name)
 
     try:
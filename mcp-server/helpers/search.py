@@ -3,8 +3,72 @@
 These helpers find things across the Dataiku instance.
 """
 
+import logging
 import re
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Optional
+
+from dataikuapi.utils import DataikuException
+from requests import RequestException
+
+from ._cache import get_project
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of projects scanned concurrently
+MAX_WORKERS = 16
+
+
+@lru_cache(maxsize=128)
+def _matcher(pattern: str) -> Callable[[str], bool]:
+    """Build a case-insensitive matcher for a pattern, cached across calls.
+
+    Patterns without regex metacharacters are matched with a plain substring
+    check instead of going through the regex engine.
+    """
+    if re.escape(pattern) == pattern:
+        needle = pattern.lower()
+        return lambda text: needle in text.lower()
+    return re.compile(pattern, re.IGNORECASE).search
+
+
+def _scan_projects(client, scan_project: Callable[[str], list],
+                   project_key: Optional[str] = None) -> list:
+    """Run scan_project on each project concurrently and flatten the results.
+
+    Args:
+        client: DSSClient instance
+        scan_project: Function taking a project key and returning a list of matches
+        project_key: Optional project to limit the scan to
+
+    Returns:
+        list of matches, in project order
+    """
+    if project_key:
+        project_keys = [project_key]
+    else:
+        project_keys = [p.get("projectKey") for p in client.list_projects()]
+
+    if len(project_keys) <= 1:
+        return list(chain.from_iterable(map(scan_project, project_keys)))
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(project_keys))) as executor:
+        return list(chain.from_iterable(executor.map(scan_project, project_keys)))
+
+
+def _dataset_params(project, dataset: dict) -> dict:
+    """Get a dataset's params, avoiding a get_settings() call when possible.
+
+    list_datasets() items already carry the dataset params on most DSS versions;
+    only fall back to fetching the settings when they are missing.
+    """
+    params = dataset.get("params")
+    if params is None:
+        settings = project.get_dataset(dataset.get("name")).get_settings()
+        params = settings.get_raw().get("params", {})
+    return params
 
 
 def find_datasets(client, pattern: str, project_key: Optional[str] = None) -> list:
@@ -18,31 +82,26 @@ def find_datasets(client, pattern: str, project_key: Optional[str] = None) -> li
     Returns:
         list of dicts with project_key, name, type
     """
-    regex = re.compile(pattern, re.IGNORECASE)
-    results = []
-
-    if project_key:
-        projects = [{"projectKey": project_key}]
-    else:
-        projects = client.list_projects()
+    matches = _matcher(pattern)
 
-    for p in projects:
-        pkey = p.get("projectKey")
+    def scan_project(pkey):
+        results = []
         try:
-            project = client.get_project(pkey)
+            project = get_project(client, pkey)
             datasets = project.list_datasets()
             for d in datasets:
                 name = d.get("name", "")
-                if regex.search(name):
+                if matches(name):
                     results.append({
                         "project_key": pkey,
                         "name": name,
                         "type": d.get("type")
                     })
-        except:
-            continue
+        except (DataikuException, RequestException) as e:
+            logger.debug("Skipping project %s: %s", pkey, e)
+        return results
 
-    return results
+    return _scan_projects(client, scan_project, project_key)
 
 
 def find_recipes(client, pattern: str, project_key: Optional[str] = None) -> list:
@@ -56,31 +115,26 @@ def find_recipes(client, pattern: str, project_key: Optional[str] = None) -> lis
     Returns:
         list of dicts with project_key, name, type
     """
-    regex = re.compile(pattern, re.IGNORECASE)
-    results = []
+    matches = _matcher(pattern)
 
-    if project_key:
-        projects = [{"projectKey": project_key}]
-    else:
-        projects = client.list_projects()
-
-    for p in projects:
-        pkey = p.get("projectKey")
+    def scan_project(pkey):
+        results = []
         try:
-            project = client.get_project(pkey)
+            project = get_project(client, pkey)
             recipes = project.list_recipes()
             for r in recipes:
                 name = r.get("name", "")
-                if regex.search(name):
+                if matches(name):
                     results.append({
                         "project_key": pkey,
                         "name": name,
                         "type": r.get("type")
                     })
-        except:
-            continue
+        except (DataikuException, RequestException) as e:
+            logger.debug("Skipping project %s: %s", pkey, e)
+        return results
 
-    return results
+    return _scan_projects(client, scan_project, project_key)
 
 
 def find_scenarios(client, pattern: str, project_key: Optional[str] = None) -> list:
@@ -94,56 +148,48 @@ def find_scenarios(client, pattern: str, project_key: Optional[str] = None) -> l
     Returns:
         list of dicts with project_key, id, name
     """
-    regex = re.compile(pattern, re.IGNORECASE)
-    results = []
-
-    if project_key:
-        projects = [{"projectKey": project_key}]
-    else:
-        projects = client.list_projects()
+    matches = _matcher(pattern)
 
-    for p in projects:
-        pkey = p.get("projectKey")
+    def scan_project(pkey):
+        results = []
         try:
-            project = client.get_project(pkey)
+            project = get_project(client, pkey)
             scenarios = project.list_scenarios()
             for s in scenarios:
                 name = s.get("name", "")
                 sid = s.get("id", "")
-                if regex.search(name) or regex.search(sid):
+                if matches(name) or matches(sid):
                     results.append({
                         "project_key": pkey,
                         "id": sid,
                         "name": name
                     })
-        except:
-            continue
+        except (DataikuException, RequestException) as e:
+            logger.debug("Skipping project %s: %s", pkey, e)
+        return results
 
-    return results
+    return _scan_projects(client, scan_project, project_key)
 
 
-def find_by_connection(client, connection_name: str) -> list:
+def find_by_connection(client, connection_name: str,
+                       project_key: Optional[str] = None) -> list:
     """Find all datasets using a specific connection.
 
     Args:
         client: DSSClient instance
         connection_name: Name of the connection to search for
+        project_key: Optional project to limit search to
 
     Returns:
         list of dicts with project_key, name, type
     """
-    results = []
-
-    projects = client.list_projects()
-    for p in projects:
-        pkey = p.get("projectKey")
+    def scan_project(pkey):
+        results = []
         try:
-            project = client.get_project(pkey)
+            project = get_project(client, pkey)
             datasets = project.list_datasets()
             for d in datasets:
-                ds = project.get_dataset(d.get("name"))
-                settings = ds.get_settings()
-                params = settings.get_raw().get("params", {})
+                params = _dataset_params(project, d)
                 if params.get("connection") == connection_name:
                     results.append({
                         "project_key": pkey,
@@ -151,10 +197,11 @@ def find_by_connection(client, connection_name: str) -> list:
                         "type": d.get("type"),
                         "path": params.get("path") or params.get("table")
                     })
-        except:
-            continue
+        except (DataikuException, RequestException) as e:
+            logger.debug("Skipping project %s: %s", pkey, e)
+        return results
 
-    return results
+    return _scan_projects(client, scan_project, project_key)
 
 
 def find_by_type(client, dataset_type: str, project_key: Optional[str] = None) -> list:
@@ -168,23 +215,16 @@ def find_by_type(client, dataset_type: str, project_key: Optional[str] = None) -
     Returns:
         list of dicts with project_key, name, connection
     """
-    results = []
-
-    if project_key:
-        projects = [{"projectKey": project_key}]
-    else:
-        projects = client.list_projects()
+    dataset_type_lower = dataset_type.lower()
 
-    for p in projects:
-        pkey = p.get("projectKey")
+    def scan_project(pkey):
+        results = []
         try:
-            project = client.get_project(pkey)
+            project = get_project(client, pkey)
             datasets = project.list_datasets()
             for d in datasets:
-                if d.get("type", "").lower() == dataset_type.lower():
-                    ds = project.get_dataset(d.get("name"))
-                    settings = ds.get_settings()
-                    params = settings.get_raw().get("params", {})
+                if d.get("type", "").lower() == dataset_type_lower:
+                    params = _dataset_params(project, d)
                     results.append({
                         "project_key": pkey,
                         "name": d.get("name"),
@@ -192,10 +232,11 @@ def find_by_type(client, dataset_type: str, project_key: Optional[str] = None) -
                         "connection": params.get("connection"),
                         "path": params.get("path") or params.get("table")
                     })
-        except:
-            continue
+        except (DataikuException, RequestException) as e:
+            logger.debug("Skipping project %s: %s", pkey, e)
+        return results
 
-    return results
+    return _scan_projects(client, scan_project, project_key)
 
 
 def find_users(client, pattern: str) -> list:
@@ -208,14 +249,14 @@ def find_users(client, pattern: str) -> list:
     Returns:
         list of dicts with login, displayName, groups
     """
-    regex = re.compile(pattern, re.IGNORECASE)
+    matches = _matcher(pattern)
     results = []
 
     users = client.list_users()
     for u in users:
         login = u.get("login", "")
         display = u.get("displayName", "")
-        if regex.search(login) or regex.search(display):
+        if matches(login) or matches(display):
             results.append({
                 "login": login,
                 "displayName": display,
@@ -15,22 +15,31 @@ Usage:
 
 import sys
 import os
+import io
 import json
-from io import StringIO
+import traceback
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
+from types import MappingProxyType
 
 # Add paths for imports
 server_dir = Path(__file__).parent
 parent_dir = server_dir.parent
-sys.path.insert(0, str(parent_dir))  # For client.py
-sys.path.insert(0, str(server_dir))  # For helpers package
+# parent_dir for client.py, server_dir for the helpers package (server_dir wins).
+# Move existing entries to the front so the order holds without duplicates.
+for path in (str(parent_dir), str(server_dir)):
+    while path in sys.path:
+        sys.path.remove(path)
+    sys.path.insert(0, path)
+del path
 
 from mcp.server.fastmcp import FastMCP
 from dataikuapi import DSSClient
+from requests.adapters import HTTPAdapter
 
 import helpers
-from helpers import jobs, inspection, search, export
 
 # =============================================================================
 # Instance Configuration - Load from config file
@@ -41,18 +50,19 @@ EXAMPLE_CONFIG_FILE = parent_dir / ".dataiku-instances.example.json"
 
 def load_instances():
     """Load instance configurations from the config file."""
-    if not CONFIG_FILE.exists():
+    try:
+        with open(CONFIG_FILE) as f:
+            config = json.load(f)
+    except FileNotFoundError:
         return None, None
 
-    with open(CONFIG_FILE) as f:
-        config = json.load(f)
-
     return config.get("instances", {}), config.get("default", None)
 
 INSTANCES, DEFAULT_INSTANCE = load_instances()
 
 # Check if config is missing
 _config_missing = INSTANCES is None or len(INSTANCES) == 0
+_CONFIG_MISSING_MSG = f"No instances configured. Please create {CONFIG_FILE}"
 
 if _config_missing:
     _instructions = dedent(f"""
@@ -116,22 +126,29 @@ else:
 # =============================================================================
 
 _current_instance = DEFAULT_INSTANCE
-_client = None
+
+@lru_cache(maxsize=4)
+def _connect(url: str, api_key: str) -> DSSClient:
+    """Create a DSSClient, cached per (url, api_key) so its HTTP pool is reused."""
+    client = DSSClient(url, api_key)
+    # Share keep-alive sockets between calls (and threads) instead of reconnecting
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100)
+    client._session.mount("http://", adapter)
+    client._session.mount("https://", adapter)
+    return client
 
 def get_dataiku_client():
     """Get or create the Dataiku client for current instance."""
-    global _client
-    if _current_instance and _current_instance in INSTANCES:
-        instance_config = INSTANCES[_current_instance]
-        _client = DSSClient(instance_config["url"], instance_config["api_key"])
-    return _client
+    instance_config = INSTANCES.get(_current_instance)
+    if instance_config is None:
+        return None
+    return _connect(instance_config["url"], instance_config["api_key"])
 
 def switch_instance(instance_name: str) -> bool:
     """Switch to a different Dataiku instance."""
-    global _current_instance, _client
+    global _current_instance
     if instance_name in INSTANCES:
         _current_instance = instance_name
-        _client = None  # Reset client so it reconnects
         return True
     return False
 
@@ -142,15 +159,55 @@ def switch_instance(instance_name: str) -> bool:
 # Initialize MCP server
 mcp = FastMCP("dataiku", instructions=_instructions)
 
-# Persistent execution namespace
-execution_globals = {
-    "__builtins__": __builtins__,
+# Names the server provides to user code (read-only)
+_BASE_NAMESPACE = MappingProxyType({
     "helpers": helpers,
-    "jobs": jobs,
-    "inspection": inspection,
-    "search": search,
-    "export": export,
-}
+})
+
+# Persistent execution namespace
+execution_globals = dict(_BASE_NAMESPACE)
+
+
+@lru_cache(maxsize=256)
+def _compile(code: str):
+    """Compile user code once; repeated snippets reuse the cached code object."""
+    return compile(code, "<string>", "exec")
+
+
+# Maximum characters of stdout returned from one execute_python call
+MAX_OUTPUT_CHARS = 1_000_000
+
+
+class _ListStdout(io.TextIOBase):
+    """Text stdout replacement that collects writes in a list.
+
+    Joining once at the end avoids StringIO's repeated buffer growth when user
+    code prints a lot. Output past `limit` characters is counted but not kept.
+    """
+
+    def __init__(self, limit: int = MAX_OUTPUT_CHARS):
+        super().__init__()
+        self.buf = []
+        self.size = 0
+        self.limit = limit
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        if not isinstance(s, str):
+            raise TypeError(f"string argument expected, got '{type(s).__name__}'")
+        if self.size < self.limit:
+            self.buf.append(s[:self.limit - self.size])
+        self.size += len(s)
+        return len(s)
+
+    def getvalue(self) -> str:
+        output = "".join(self.buf)
+        if self.size > self.limit:
+            output += (f"\n... (output truncated: showing the first {self.limit:,} "
+                       f"of {self.size:,} characters)")
+        return output
 
 
 @mcp.tool()
@@ -166,7 +223,7 @@ def use_instance(instance_name: str) -> str:
         Confirmation message with instance details
     """
     if _config_missing:
-        return f"No instances configured. Please create {CONFIG_FILE}"
+        return _CONFIG_MISSING_MSG
 
     if instance_name not in INSTANCES:
         available = ", ".join(INSTANCES.keys())
@@ -189,7 +246,7 @@ def list_instances() -> str:
         List of configured instances with their details
     """
     if _config_missing:
-        return f"No instances configured. Please create {CONFIG_FILE}"
+        return _CONFIG_MISSING_MSG
 
     lines = [f"Current instance: {_current_instance}", "", "Available instances:"]
     for name, config in INSTANCES.items():
@@ -200,7 +257,6 @@ def list_instances() -> str:
     return "\n".join(lines)
 
 
-@mcp.tool()
 def execute_python(code: str) -> str:
     """Execute Python code with pre-configured Dataiku client.
 
@@ -211,7 +267,8 @@ def execute_python(code: str) -> str:
     - helpers.search: find_datasets, find_recipes, find_by_connection
     - helpers.export: to_records, sample, head, get_schema
 
-    Variables persist across calls within the same session.
+    Variables persist across calls within the same session. Output longer
+    than {max_output_chars:,} characters is truncated.
 
     Args:
         code: Python code to execute
@@ -219,29 +276,101 @@ def execute_python(code: str) -> str:
     Returns:
         stdout output from the code, or error message if execution fails
     """
-    if _config_missing:
-        return f"No instances configured. Please create {CONFIG_FILE}"
-
-    # Ensure client is in namespace
+    # Restore server-provided names in case earlier code shadowed them
+    execution_globals.update(_BASE_NAMESPACE)
     execution_globals["client"] = get_dataiku_client()
 
-    # Capture stdout
-    stdout_capture = StringIO()
-    old_stdout = sys.stdout
-    sys.stdout = stdout_capture
-
+    # Nothing has run yet, so a syntax error needs no output or stack
     try:
-        # Execute the code
-        exec(code, execution_globals)
-        output = stdout_capture.getvalue()
-        return output if output else "(executed successfully, no output)"
+        compiled = _compile(code)
+    except SyntaxError as e:
+        line = f"\n    {e.text.strip()}" if e.text else ""
+        return f"Error: {type(e).__name__}: {e.msg} (line {e.lineno}){line}"
     except Exception as e:
-        import traceback
-        error_output = stdout_capture.getvalue()
-        tb = traceback.format_exc()
-        return f"{error_output}\nError: {type(e).__name__}: {e}\n\n{tb}"
-    finally:
-        sys.stdout = old_stdout
+        # e.g. ValueError for null bytes, RecursionError/MemoryError for huge input
+        return f"Error: {type(e).__name__}: {e}"
+
+    # Capture stdout
+    stdout_capture = _ListStdout()
+
+    with redirect_stdout(stdout_capture):
+        try:
+            # Execute the code
+            exec(compiled, execution_globals)
+        except Exception as e:
+            error_output = stdout_capture.getvalue()
+            if isinstance(e, NameError):
+                # Usually a typo or a variable from an earlier session. When it was
+                # raised directly in the user's code, its line number is enough.
+                tb = e.__traceback__
+                while tb.tb_next is not None:
+                    tb = tb.tb_next
+                if tb.tb_frame.f_code.co_filename == "<string>":
+                    return f"{error_output}\nError: {type(e).__name__}: {e} (line {tb.tb_lineno})"
+            # Only show frames from the user's code and the helpers, not this server
+            tb_exc = traceback.TracebackException.from_exception(e)
+            tb_exc.stack = traceback.StackSummary.from_list(
+                [frame for frame in tb_exc.stack if frame.filename != __file__]
+            )
+            tb = "".join(tb_exc.format())
+            return f"{error_output}\nError: {type(e).__name__}: {e}\n\n{tb}"
+
+    # Skip the join entirely for silent code (assignments, imports, ...)
+    if not stdout_capture.buf:
+        return "(executed successfully, no output)"
+    return stdout_capture.getvalue() or "(executed successfully, no output)"
+
+
+def _execute_python_unconfigured(code: str) -> str:
+    return _CONFIG_MISSING_MSG
+
+
+# Pick the implementation once at startup instead of checking the config on
+# every call; both are exposed under the same name and description
+mcp.tool(
+    name="execute_python",
+    description=execute_python.__doc__.format(max_output_chars=MAX_OUTPUT_CHARS),
+)(
+    _execute_python_unconfigured if _config_missing else execute_python
+)
+
+
+# list_helpers output is constant, so build it once at import
+_HELPERS_DOC = sys.intern("\n".join([
+    "=== helpers.jobs ===",
+    "  build_and_wait(client, project_key, dataset_name, build_mode='RECURSIVE_BUILD', timeout=600)",
+    "  run_scenario_and_wait(client, project_key, scenario_id, timeout=600)",
+    "  run_recipe_and_wait(client, project_key, recipe_name, timeout=600)",
+    "  wait_for_job(job, timeout=600, poll_interval=1, max_poll_interval=30)",
+    "  get_job_log(client, project_key, job_id)",
+    "  compute_and_apply_schema(client, project_key, recipe_name)  # REQUIRED after creating/modifying recipes",
+    "",
+    "=== helpers.inspection ===",
+    "  dataset_info(client, project_key, dataset_name, sample_size=5)",
+    "  project_summary(client, project_key)",
+    "  list_projects_summary(client)",
+    "  connection_info(client, connection_name)",
+    "  list_connections_summary(client)",
+    "  user_info(client, login=None)",
+    "",
+    "=== helpers.search ===",
+    "  find_datasets(client, pattern, project_key=None)",
+    "  find_recipes(client, pattern, project_key=None)",
+    "  find_scenarios(client, pattern, project_key=None)",
+    "  find_by_connection(client, connection_name, project_key=None)",
+    "  find_by_type(client, dataset_type, project_key=None)",
+    "  find_users(client, pattern)",
+    "",
+    "=== helpers.export ===",
+    "  to_records(client, project_key, dataset_name, limit=100)",
+    "  sample(client, project_key, dataset_name, n=10)",
+    "  get_schema(client, project_key, dataset_name)",
+    "  get_column_names(client, project_key, dataset_name)",
+    "  count_rows(client, project_key, dataset_name)",
+    "  head(client, project_key, dataset_name, n=5)",
+    "  describe(client, project_key, dataset_name)",
+    "  to_csv_string(client, project_key, dataset_name, limit=100)"
+]))
 
 
 @mcp.tool()
@@ -251,46 +380,7 @@ def list_helpers() -> str:
     Returns:
         Formatted list of all helper modules and functions
     """
-    output = []
-
-    output.append("=== helpers.jobs ===")
-    output.append("  build_and_wait(client, project_key, dataset_name, build_mode='RECURSIVE_BUILD', timeout=600)")
-    output.append("  run_scenario_and_wait(client, project_key, scenario_id, timeout=600)")
-    output.append("  run_recipe_and_wait(client, project_key, recipe_name, timeout=600)")
-    output.append("  wait_for_job(job, timeout=600, poll_interval=2)")
-    output.append("  get_job_log(client, project_key, job_id)")
-    output.append("  compute_and_apply_schema(client, project_key, recipe_name)  # REQUIRED after creating/modifying recipes")
-    output.append("")
-
-    output.append("=== helpers.inspection ===")
-    output.append("  dataset_info(client, project_key, dataset_name, sample_size=5)")
-    output.append("  project_summary(client, project_key)")
-    output.append("  list_projects_summary(client)")
-    output.append("  connection_info(client, connection_name)")
-    output.append("  list_connections_summary(client)")
-    output.append("  user_info(client, login=None)")
-    output.append("")
-
-    output.append("=== helpers.search ===")
-    output.append("  find_datasets(client, pattern, project_key=None)")
-    output.append("  find_recipes(client, pattern, project_key=None)")
-    output.append("  find_scenarios(client, pattern, project_key=None)")
-    output.append("  find_by_connection(client, connection_name)")
-    output.append("  find_by_type(client, dataset_type, project_key=None)")
-    output.append("  find_users(client, pattern)")
-    output.append("")
-
-    output.append("=== helpers.export ===")
-    output.append("  to_records(client, project_key, dataset_name, limit=100)")
-    output.append("  sample(client, project_key, dataset_name, n=10)")
-    output.append("  get_schema(client, project_key, dataset_name)")
-    output.append("  get_column_names(client, project_key, dataset_name)")
-    output.append("  count_rows(client, project_key, dataset_name)")
-    output.append("  head(client, project_key, dataset_name, n=5)")
-    output.append("  describe(client, project_key, dataset_name)")
-    output.append("  to_csv_string(client, project_key, dataset_name, limit=100)")
-
-    return "\n".join(output)
+    return _HELPERS_DOC
 
 
 if __name__ == "__main__":